@@ -1,6 +1,7 @@
 import os, json
 
 from PySide6.QtWidgets import ( 
+    QApplication,
     QMainWindow,
     QSplitter,
     QWidget,
@@ -15,6 +16,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QGraphicsView,
     QGraphicsScene,
+    QGraphicsItem,
     QGraphicsItemGroup,
     QGraphicsPolygonItem,
     QGraphicsLineItem,
@@ -24,21 +26,156 @@ from PySide6.QtGui import (
     QBrush,
     QColor,
     QPixmap,
-    QImage,
+    QPixmapCache,
     QPen,
+    QPainterPath,
     QAction,
     QKeySequence,
-    QPolygonF
+    QPolygonF,
+    QIntValidator,
+    QImageReader
 )
 from PySide6.QtCore import (
     Qt,
     QRectF,
-    QPointF
+    QPointF,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal
 )
 
+try:
+    import orjson
+    
+    load_json = orjson.loads
+    
+    def dump_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    load_json = json.loads
+    
+    def dump_json(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 JSON_NAME = "sprite_data"
+PIXMAP_CACHE_LIMIT = 131072 # in KiB
+EDIT_DEBOUNCE_MS = 50
+IMAGE_EXTENSIONS = frozenset(("png", "jpg", "jpeg"))
+FOLDER_ROLE = Qt.UserRole + 1
+
+def scan_folder(path):
+    # one scandir pass, split into sub folders and images, both sorted by name
+    dirs = []
+    images = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry)
+            else:
+                _, dot, ext = entry.name.rpartition(".")
+                if dot and ext.lower() in IMAGE_EXTENSIONS:
+                    images.append(entry)
+    dirs.sort(key=lambda e: e.name)
+    images.sort(key=lambda e: e.name)
+    return dirs, images
+
+def read_image_size(path):
+    # only reads the header, no pixels are decoded
+    size = QImageReader(path).size()
+    if not size.isValid():
+        return None
+    return (size.width(), size.height())
+
+class FolderWalkerSignals(QObject):
+    # folder, listing, image_paths, data, dims, error
+    finished = Signal(str, object, object, object, object, str)
+
+class FolderWalker(QRunnable):
+    def __init__(self, folder):
+        super().__init__()
+        self.folder = folder
+        self.signals = FolderWalkerSignals()
+
+    def run(self):
+        # runs on a pool thread, so no widgets in here
+        try:
+            result = self.walk()
+        except Exception as e:
+            # malformed entries in the json, still hand control back to the ui
+            result = (self.folder, {}, [], {}, {}, str(e))
+        self.signals.finished.emit(*result)
+
+    def walk(self):
+        folder = self.folder
+        error = ""
+        
+        # load frame data from json if there is one already
+        json_path = os.path.join(folder, f"{JSON_NAME}.json")
+        data = {}
+        if os.path.exists(json_path):
+            try:
+                with open(json_path, "rb") as f:
+                    loaded = load_json(f.read())
+                for k, v in loaded.items():
+                    data[os.path.join(folder, k)] = v
+            except Exception as e:
+                error = str(e)
+                data.clear()
+        
+        # walk everything up front, the data needs every image path
+        listing = {}
+        image_paths = []
+        valid_paths = set()
+        stack = [folder]
+        while stack:
+            root = stack.pop()
+            try:
+                dirs, files = scan_folder(root)
+            except OSError:
+                continue
+            listing[root] = (dirs, files)
+            for f in files:
+                image_paths.append(f.path)
+                valid_paths.add(f.path)
+            # pushed in reverse so folders are walked in sorted order
+            stack.extend(reversed([d.path for d in dirs]))
+        
+        # remove deleted images from json
+        for k in data.keys() - valid_paths:
+            del data[k]
+        # ensure every image has origin_x and origin_y
+        dims_cache = {}
+        for path in image_paths:
+            if path not in data:
+                # only the size is needed, so don't decode the whole image
+                dims = read_image_size(path)
+                if dims:
+                    dims_cache[path] = dims
+                    data[path] = {}
+                    entry = data[path]
+                    entry["frame_width"], entry["frame_height"] = dims
+                    entry["image_width"], entry["image_height"] = dims
+                    entry["frame_count_x"] = 1
+                    entry["frame_count_y"] = 1
+                    entry["origin_x"] = 0
+                    entry["origin_y"] = 0
+                    entry["atlas_page"] = 0
+            else:
+                entry = data[path]
+                if "atlas_page" not in entry:
+                    entry["atlas_page"] = 0
+                # saved sizes spare a header read, load_pixmap corrects them if the image changed
+                if "image_width" in entry and "image_height" in entry:
+                    dims_cache[path] = (entry["image_width"], entry["image_height"])
+        
+        return (folder, listing, image_paths, data, dims_cache, error)
 
 class OriginPoint(QGraphicsItemGroup):
+    _LINE_PEN = QPen(QColor(255, 255, 255), 1)
+    _RHOMBUS_BRUSH = QBrush(QColor(128, 128, 128, 200))
+
     def __init__(self, sprite_manager, x=0, y=0, size=8):
         super().__init__()
         self.sprite_manager = sprite_manager
@@ -52,8 +189,8 @@ class OriginPoint(QGraphicsItemGroup):
         ]
         rhombus_polygon = QPolygonF(rhombus_points)
         self.rhombus = QGraphicsPolygonItem(rhombus_polygon)
-        self.rhombus.setBrush(QBrush(QColor(128, 128, 128, 200)))
-        self.rhombus.setPen(QPen(QColor(255, 255, 255), 1))
+        self.rhombus.setBrush(self._RHOMBUS_BRUSH)
+        self.rhombus.setPen(self._LINE_PEN)
         
         # create anchor lines
         line_length = size * 0.5
@@ -62,11 +199,10 @@ class OriginPoint(QGraphicsItemGroup):
         self.left_line = QGraphicsLineItem(-size, 0, -size - line_length, 0)
         self.right_line = QGraphicsLineItem(size, 0, size + line_length, 0)
         
-        line_pen = QPen(QColor(255, 255, 255), 1)
-        self.top_line.setPen(line_pen)
-        self.bottom_line.setPen(line_pen)
-        self.left_line.setPen(line_pen)
-        self.right_line.setPen(line_pen)
+        self.top_line.setPen(self._LINE_PEN)
+        self.bottom_line.setPen(self._LINE_PEN)
+        self.left_line.setPen(self._LINE_PEN)
+        self.right_line.setPen(self._LINE_PEN)
         
         # add all parts to the group
         self.addToGroup(self.rhombus)
@@ -75,6 +211,10 @@ class OriginPoint(QGraphicsItemGroup):
         self.addToGroup(self.left_line)
         self.addToGroup(self.right_line)
         
+        # the parts never deform, so let qt blit them from a cached pixmap
+        for item in (self.rhombus, self.top_line, self.bottom_line, self.left_line, self.right_line):
+            item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        
         # set position and properties
         self.setPos(x, y)
         self.setFlag(QGraphicsItemGroup.ItemIsMovable, True)
@@ -90,29 +230,32 @@ class OriginPoint(QGraphicsItemGroup):
 
     def itemChange(self, change, value):
         if change == QGraphicsItemGroup.ItemPositionChange and self.scene():
-            new_pos = value
+            # snap to integer pixel coordinates, scene space is image space
+            new_pos = QPointF(value.toPoint())
             
-            # snap to integer pixel coordinates in original image space
-            if self.sprite_manager and self.sprite_manager.zoom > 0:
-                # convert to original image coordinates, round to int, then back to zoomed
-                original_x = new_pos.x() / self.sprite_manager.zoom
-                original_y = new_pos.y() / self.sprite_manager.zoom
-                snapped_original_x = round(original_x)
-                snapped_original_y = round(original_y)
-                new_pos.setX(snapped_original_x * self.sprite_manager.zoom)
-                new_pos.setY(snapped_original_y * self.sprite_manager.zoom)
+            # sub-pixel moves snap back onto the current position, nothing to update
+            if new_pos == self.pos():
+                return new_pos
                 
+            # only track the position while dragging, the fields are written on release
             if self.sprite_manager:
-                # convert from zoomed coordinates to original image coordinates
-                original_x = int(new_pos.x() / self.sprite_manager.zoom)
-                original_y = int(new_pos.y() / self.sprite_manager.zoom)
-                self.sprite_manager.origin_x_entry.setText(str(original_x))
-                self.sprite_manager.origin_y_entry.setText(str(original_y))
-                self.sprite_manager.update_data(self.sprite_manager.data[self.sprite_manager.current_path])
+                self.sprite_manager._origin_x = int(new_pos.x())
+                self.sprite_manager._origin_y = int(new_pos.y())
                 
             return new_pos
         return super().itemChange(change, value)
 
+    def mousePressEvent(self, event):
+        # a typed origin still waiting on its timer would land after the drag and undo it
+        if self.sprite_manager:
+            self.sprite_manager.flush_pending_edits()
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if self.sprite_manager:
+            self.sprite_manager.flush_origin()
+
 class ImageView(QGraphicsView):
     def __init__(self, sprite_manager=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -121,7 +264,9 @@ class ImageView(QGraphicsView):
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
         self._zoom = 1.0
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # nothing in the scene is antialiased or leaves the painter dirty
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing)
 
     def wheelEvent(self, event):
         zoomInFactor = 1.25
@@ -151,6 +296,8 @@ class ImageView(QGraphicsView):
             self.sprite_manager.origin_point.update_scale()
 
 class SpriteManager(QMainWindow):
+    _GRID_PEN = QPen(QColor(0, 225, 255), 0)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Sprite Frame Tool")
@@ -160,17 +307,25 @@ class SpriteManager(QMainWindow):
         self.current_path = None
         self.img_width = 0
         self.img_height = 0
-        self.zoom = 1.0
         self.graphics_zoom = 1.0
-        self.pan_x = 0
-        self.pan_y = 0
-        self.origin_point = None
+        self._last_origin_text = None
+        self._last_count_text = None
+        self._dims_cache = {}
+        self._folder_listing = {}
+        self._walker = None
+        # parsed values of the property fields, kept in sync on edit
+        self._origin_x = 0
+        self._origin_y = 0
+        self._count_x = 1
+        self._count_y = 1
+        self._atlas_page = 0
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT)
         self.setup_ui()
         
-        save_action = QAction(self)
-        save_action.setShortcut(QKeySequence("Ctrl+S"))
-        save_action.triggered.connect(self.export_json)
-        self.addAction(save_action)
+        self.save_action = QAction(self)
+        self.save_action.setShortcut(QKeySequence("Ctrl+S"))
+        self.save_action.triggered.connect(self.export_json)
+        self.addAction(self.save_action)
 
     def setup_ui(self):
         # main layout
@@ -226,126 +381,187 @@ class SpriteManager(QMainWindow):
         middle_layout = QVBoxLayout(middle_widget)
         self.graphics = ImageView(self)
         self.scene = QGraphicsScene()
+        # a handful of items, one of them dragged around, isn't worth a bsp tree
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.graphics.setScene(self.scene)
+        # the origin point lives for the whole session and is only moved between images
+        self.origin_point = OriginPoint(self, 0, 0, 6)
+        self.origin_point.setVisible(False)
+        self.scene.addItem(self.origin_point)
+        # same for the sprite and grid, their contents are swapped per image
+        self._pixmap_item = self.scene.addPixmap(QPixmap())
+        self._pixmap_item.setVisible(False)
+        self._grid_item = self.scene.addPath(QPainterPath(), self._GRID_PEN)
+        self._grid_item.setZValue(500)
+        self._grid_item.setVisible(False)
         middle_layout.addWidget(self.graphics, 10)
         splitter.addWidget(middle_widget)
         self.img_size_label = QLabel("")
         middle_layout.addWidget(self.img_size_label)
 
+        # coalesce editingFinished bursts from tabbing between the fields
+        self.origin_timer = self.create_debounce_timer(self.on_origin_change)
+        self.count_timer = self.create_debounce_timer(self.on_count_change)
+        int_validator = QIntValidator(self)
+
         self.prop_origin_x = QTreeWidgetItem(self.property_tree, ["Origin X"])
         self.origin_x_entry = QLineEdit()
         self.origin_x_entry.setStyleSheet("border: none;")
+        self.origin_x_entry.setValidator(int_validator)
         self.property_tree.setItemWidget(self.prop_origin_x, 1, self.origin_x_entry)
-        self.origin_x_entry.editingFinished.connect(self.on_origin_change)
+        self.origin_x_entry.editingFinished.connect(self.origin_timer.start)
 
         self.prop_origin_y = QTreeWidgetItem(self.property_tree, ["Origin Y"])
         self.origin_y_entry = QLineEdit()
         self.origin_y_entry.setStyleSheet("border: none;")
+        self.origin_y_entry.setValidator(int_validator)
         self.property_tree.setItemWidget(self.prop_origin_y, 1, self.origin_y_entry)
-        self.origin_y_entry.editingFinished.connect(self.on_origin_change)
+        self.origin_y_entry.editingFinished.connect(self.origin_timer.start)
 
         self.prop_count_x = QTreeWidgetItem(self.property_tree, ["Frame Count X"])
         self.count_x_entry = QLineEdit()
         self.count_x_entry.setStyleSheet("border: none;")
+        self.count_x_entry.setValidator(int_validator)
         self.property_tree.setItemWidget(self.prop_count_x, 1, self.count_x_entry)
-        self.count_x_entry.editingFinished.connect(self.on_count_change)
+        self.count_x_entry.editingFinished.connect(self.count_timer.start)
 
         self.prop_count_y = QTreeWidgetItem(self.property_tree, ["Frame Count Y"])
         self.count_y_entry = QLineEdit()
         self.count_y_entry.setStyleSheet("border: none;")
+        self.count_y_entry.setValidator(int_validator)
         self.property_tree.setItemWidget(self.prop_count_y, 1, self.count_y_entry)
-        self.count_y_entry.editingFinished.connect(self.on_count_change)
+        self.count_y_entry.editingFinished.connect(self.count_timer.start)
         
         self.prop_atlas_page = QTreeWidgetItem(self.property_tree, ["Atlas Page"])
         self.atlas_page_entry = QLineEdit()
         self.atlas_page_entry.setStyleSheet("border: none;")
+        self.atlas_page_entry.setValidator(int_validator)
         self.property_tree.setItemWidget(self.prop_atlas_page, 1, self.atlas_page_entry)
         self.atlas_page_entry.editingFinished.connect(self.on_atlas_page_change)
 
         self.property_tree.expandAll()
-        self.tree.itemSelectionChanged.connect(self.on_tree_select)
+        # queued so the selection repaints before the image is loaded
+        self.tree.itemSelectionChanged.connect(self.on_tree_select, Qt.QueuedConnection)
+        self.tree.itemExpanded.connect(self.on_tree_expand)
         splitter.setSizes([400, 600])
 
+    def create_debounce_timer(self, slot):
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(EDIT_DEBOUNCE_MS)
+        timer.timeout.connect(slot)
+        return timer
+
+    def flush_pending_edits(self):
+        # run debounced edits now, before the fields are overwritten or saved
+        for timer, handler in ((self.origin_timer, self.on_origin_change), (self.count_timer, self.on_count_change)):
+            if timer.isActive():
+                timer.stop()
+                handler()
+
+    def commit_fields(self):
+        # take whatever the fields hold, even if enter wasn't pressed or focus didn't move
+        self.origin_timer.stop()
+        self.count_timer.stop()
+        self.on_origin_change()
+        self.on_count_change()
+        self.on_atlas_page_change()
+
     def center_origin(self):
-        try:
-            fw = int(self.count_x_entry.text())
-            fh = int(self.count_y_entry.text())
-            origin_x = fw // 2
-            origin_y = fh // 2
-            
-            self.origin_x_entry.setText(str(origin_x))
-            self.origin_y_entry.setText(str(origin_y))
-        except Exception:
-            pass
+        self._origin_x = self._count_x // 2
+        self._origin_y = self._count_y // 2
+        
+        self.origin_x_entry.setText(str(self._origin_x))
+        self.origin_y_entry.setText(str(self._origin_y))
 
     def load_folder_impl(self, folder):
+        self.flush_pending_edits()
         self.image_paths = []
+        self.data = {}
+        self._folder_listing = {}
         self.tree.clear()
         self.current_path = None
         
+        # images may have changed on disk since they were cached
+        QPixmapCache.clear()
+        self._dims_cache.clear()
         self.show_image()
         
-        # load frame data from json if there is one already
-        json_path = os.path.join(folder, f"{JSON_NAME}.json")
-        if os.path.exists(json_path):
-            try:
-                with open(json_path, "r") as f:
-                    loaded = json.load(f)
-                self.data = {os.path.join(folder, k): v for k, v in loaded.items()}
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load json: {e}")
-                self.data = {}
-        else:
-            self.data = {}
-        # build tree structure, folders first, but DONT show top-level folder node
-        node_map = {}
-        for root, dirs, files in os.walk(folder):
-            rel_root = os.path.relpath(root, folder)
-            if rel_root == ".":
-                parent = self.tree
-            else:
-                parent = node_map.get(os.path.dirname(root), self.tree)
-                node_id = QTreeWidgetItem(parent, [os.path.basename(root)])
-                node_map[root] = node_id
-                parent = node_id
-            dirs.sort()
-            files.sort()
-            for _ in dirs:
-                pass
-            for f in files:
-                if f.lower().endswith((".png", ".jpg", ".jpeg")):
-                    path = os.path.join(root, f)
-                    self.image_paths.append(path)
-                    item = QTreeWidgetItem(parent, [f])
-                    item.setData(0, Qt.UserRole, path)
-                    '''
-                    if path not in self.data:
-                        item.setBackground(0, QBrush(QColor(120, 120, 40)))
-                        font = item.font(0)
-                        font.setBold(True)
-                        item.setFont(0, font)
-                    '''
-        
-        # remove deleted images from json
-        valid_paths = set(self.image_paths)
-        self.data = {k: v for k, v in self.data.items() if k in valid_paths}
-        # ensure every image has origin_x and origin_y
-        for path in self.image_paths:
+        # the walk and json parsing happen on a pool thread, the ui stays usable meanwhile
+        self.btn_folder.setEnabled(False)
+        self.btn_folder_refresh.setEnabled(False)
+        self.btn_save.setEnabled(False)
+        self.save_action.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+        self._walker = FolderWalker(folder)
+        self._walker.signals.finished.connect(self.on_folder_walked, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._walker)
+
+    def on_folder_walked(self, folder, listing, image_paths, data, dims, error):
+        self._walker = None
+        QApplication.restoreOverrideCursor()
+        self.btn_folder.setEnabled(True)
+        self.btn_folder_refresh.setEnabled(True)
+        self.btn_save.setEnabled(True)
+        self.save_action.setEnabled(True)
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to load json: {error}")
+        
+        self._folder_listing = listing
+        self.image_paths = image_paths
+        self.data = data
+        self._dims_cache.update(dims)
+        
+        # build tree structure, but DONT show top-level folder node
+        # sub folders only get their items once they're expanded
+        sorting = self.tree.isSortingEnabled()
+        self.tree.setSortingEnabled(False)
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            self.populate_tree_node(None, folder)
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+            self.tree.setSortingEnabled(sorting)
+
+    def populate_tree_node(self, parent, folder):
+        dirs, files = self._folder_listing.get(folder, ([], []))
+        items = []
+        for f in files:
+            path = f.path
+            item = QTreeWidgetItem([f.name])
+            item.setData(0, Qt.UserRole, path)
+            '''
             if path not in self.data:
-                img = QImage(path)
-                if img:
-                    self.data[path] = {}
-                    data = self.data[path]
-                    data["frame_width"] = int(img.width())
-                    data["frame_height"] = int(img.height())
-                    data["frame_count_x"] = 1
-                    data["frame_count_y"] = 1
-                    data["origin_x"] = 0
-                    data["origin_y"] = 0
-                    data["atlas_page"] = 0
-            else:
-                if "atlas_page" not in self.data[path]:
-                    self.data[path]["atlas_page"] = 0
+                item.setBackground(0, QBrush(QColor(120, 120, 40)))
+                font = item.font(0)
+                font.setBold(True)
+                item.setFont(0, font)
+            '''
+            items.append(item)
+        # folder nodes go after the files
+        for d in dirs:
+            node = QTreeWidgetItem([d.name])
+            sub_dirs, sub_files = self._folder_listing.get(d.path, ([], []))
+            if sub_dirs or sub_files:
+                # empty placeholder child so the node can be expanded
+                node.setData(0, FOLDER_ROLE, d.path)
+                QTreeWidgetItem(node)
+            items.append(node)
+        if parent is None:
+            self.tree.addTopLevelItems(items)
+        else:
+            parent.addChildren(items)
+
+    def on_tree_expand(self, item):
+        folder = item.data(0, FOLDER_ROLE)
+        if not folder:
+            return
+        # swap the placeholder for the real items, only once per node
+        item.setData(0, FOLDER_ROLE, None)
+        item.takeChildren()
+        self.populate_tree_node(item, folder)
 
     def load_existing_folder(self):
         self.load_folder_impl(self.current_folder)
@@ -360,12 +576,12 @@ class SpriteManager(QMainWindow):
         self.setWindowTitle(f"Sprite Frame Tool - {folder}")
             
         self.current_folder = folder
-        self.btn_folder_refresh.setEnabled(True)
-        self.btn_save.setEnabled(True)
         
         self.load_folder_impl(folder)
 
     def on_tree_select(self):
+        # edits still belong to the previous sprite
+        self.flush_pending_edits()
         selected = self.tree.selectedItems()
         if not selected:
             return
@@ -373,72 +589,107 @@ class SpriteManager(QMainWindow):
         path = item.data(0, Qt.UserRole)
         if path:
             self.current_path = path
-            self.zoom = 1.0
-            self.pan_x = 0
-            self.pan_y = 0
             self.graphics.resetZoom()
-            if self.origin_point:
-                self.scene.removeItem(self.origin_point)
-                self.origin_point = None
-            self.apply_frame()
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                self.apply_frame()
+            finally:
+                QApplication.restoreOverrideCursor()
+
+    def clear_scene(self):
+        self._pixmap_item.setPixmap(QPixmap())
+        self._pixmap_item.setVisible(False)
+        self._grid_item.setVisible(False)
+        self.origin_point.setVisible(False)
+        self.img_size_label.setText("")
 
     def show_image(self):
         path = self.current_path
         if not path or not os.path.exists(path):
-            self.scene.clear()
-            self.origin_point = None
-            self.img_size_label.setText("")
+            self.clear_scene()
             return
-        img = QImage(path)
-        if img.isNull():
-            self.scene.clear()
-            self.origin_point = None
-            self.img_size_label.setText("")
+        dims = self.image_size(path)
+        if not dims:
+            self.clear_scene()
             return
         
-        pixmap = QPixmap.fromImage(img)
-        
-        self.img_width = img.width()
-        self.img_height = img.height()
+        self.img_width, self.img_height = dims
         
-        # apply zoom
-        zoomed_pixmap = pixmap.scaled(pixmap.width() * self.zoom, pixmap.height() * self.zoom, Qt.KeepAspectRatio, Qt.FastTransformation)
-        self.scene.clear()
-        self.origin_point = None
+        pixmap = QPixmap()
+        cached = QPixmapCache.find(path, pixmap)
         
-        self.graphics.setSceneRect(QRectF(-100, -100, zoomed_pixmap.width() + 200, zoomed_pixmap.height() + 200))
-        self.scene.addPixmap(zoomed_pixmap)
+        # zoom is handled by the view transform, the pixmap stays at native size
+        self.graphics.setSceneRect(QRectF(-100, -100, self.img_width + 200, self.img_height + 200))
+        self._pixmap_item.setPixmap(pixmap)
+        self._pixmap_item.setVisible(True)
         
-        origin_x = int(float(self.origin_x_entry.text()))
-        origin_y = int(float(self.origin_y_entry.text()))
+        self.update_grid()
+        self._grid_item.setVisible(True)
+            
+        self.graphics_zoom = self.graphics._zoom
+        self.origin_point.update_scale()
+        self.origin_point.setPos(self._origin_x, self._origin_y)
+        self.origin_point.setVisible(True)
+        
+        # the pixels are decoded once the ui has caught up
+        if not cached:
+            QTimer.singleShot(0, lambda: self.load_pixmap(path))
+
+    def image_size(self, path):
+        dims = self._dims_cache.get(path)
+        if dims is None:
+            dims = read_image_size(path)
+            if dims:
+                self._dims_cache[path] = dims
+        return dims
+
+    def load_pixmap(self, path):
+        # the selection may have moved on before the decode got to run
+        if path != self.current_path or not self._pixmap_item.isVisible():
+            return
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            pixmap = QPixmap()
+            pixmap.load(path)
+        finally:
+            QApplication.restoreOverrideCursor()
+        if pixmap.isNull():
+            self.clear_scene()
+            return
+        QPixmapCache.insert(path, pixmap)
+        dims = (pixmap.width(), pixmap.height())
+        if dims != (self.img_width, self.img_height):
+            # the saved size is stale, lay everything out again with the real one
+            self._dims_cache[path] = dims
+            self.show_image()
+            self.update_data(self.data[path])
+            return
+        self._pixmap_item.setPixmap(pixmap)
+
+    def update_grid(self):
+        if not self._pixmap_item.isVisible():
+            return
         
-        count_x = int(float(self.count_x_entry.text()))
-        count_y = int(float(self.count_y_entry.text()))
+        count_x = self._count_x
+        count_y = self._count_y
         
         self.img_size_label.setText(f"Image size: {self.img_width} x {self.img_height}\nFrame size: {int(self.img_width/count_x)} x {int(self.img_height/count_y)}")
         
-        pen = QPen(QColor(0, 225, 255), 0)
+        # all grid lines go into one path so the scene only holds a single item
+        grid_path = QPainterPath()
         for i in range(count_x + 1):
-            x = (i / count_x) * self.img_width * self.zoom
+            x = (i / count_x) * self.img_width
             if i == count_x:
                 x = self.img_width
-            self.scene.addLine(x, 0, x, self.img_height, pen)
+            grid_path.moveTo(x, 0)
+            grid_path.lineTo(x, self.img_height)
         for i in range(count_y + 1):
-            y = (i / count_y) * self.img_height * self.zoom
+            y = (i / count_y) * self.img_height
             if i == count_y:
                 y = self.img_height
-            self.scene.addLine(0, y, self.img_width, y, pen)
-            
-        # remove existing origin point if it exists
-        if self.origin_point:
-            self.scene.removeItem(self.origin_point)
-            
-        # create new origin point
-        origin_zoomed_x = origin_x * self.zoom
-        origin_zoomed_y = origin_y * self.zoom
-        self.origin_point = OriginPoint(self, origin_zoomed_x, origin_zoomed_y, 6)
-        self.graphics_zoom = self.graphics._zoom
-        self.scene.addItem(self.origin_point)
+            grid_path.moveTo(0, y)
+            grid_path.lineTo(self.img_width, y)
+        self._grid_item.setPath(grid_path)
 
     def apply_frame(self):
         if not self.current_path:
@@ -446,38 +697,50 @@ class SpriteManager(QMainWindow):
         
         entry = self.data.get(self.current_path)        
         if entry:
-            self.count_x_entry.setText(str(entry["frame_count_x"]))
-            self.count_y_entry.setText(str(entry["frame_count_y"]))
-            self.origin_x_entry.setText(str(entry["origin_x"]))
-            self.origin_y_entry.setText(str(entry["origin_y"]))
-            self.atlas_page_entry.setText(str(entry["atlas_page"]))
+            self._count_x = int(entry["frame_count_x"])
+            self._count_y = int(entry["frame_count_y"])
+            self._origin_x = int(entry["origin_x"])
+            self._origin_y = int(entry["origin_y"])
+            self._atlas_page = int(entry["atlas_page"])
         else:
-            self.count_x_entry.setText(str(1))
-            self.count_y_entry.setText(str(1))
-            self.origin_x_entry.setText(str(0))
-            self.origin_y_entry.setText(str(0))
-            self.atlas_page_entry.setText(str(0))
-        
+            self._count_x = 1
+            self._count_y = 1
+            self._origin_x = 0
+            self._origin_y = 0
+            self._atlas_page = 0
+        
+        self.count_x_entry.setText(str(self._count_x))
+        self.count_y_entry.setText(str(self._count_y))
+        self.origin_x_entry.setText(str(self._origin_x))
+        self.origin_y_entry.setText(str(self._origin_y))
+        self.atlas_page_entry.setText(str(self._atlas_page))
+        
+        self._last_origin_text = (self.origin_x_entry.text(), self.origin_y_entry.text())
+        self._last_count_text = (self.count_x_entry.text(), self.count_y_entry.text())
         self.show_image()
 
     def update_data(self, entry):
-        frame_count_x = int(float(self.count_x_entry.text()))
-        frame_count_y = int(float(self.count_y_entry.text()))
+        entry["frame_count_x"] = self._count_x
+        entry["frame_count_y"] = self._count_y
         
-        entry["frame_count_x"] = frame_count_x
-        entry["frame_count_y"] = frame_count_y
+        entry["origin_x"] = self._origin_x
+        entry["origin_y"] = self._origin_y
         
-        entry["origin_x"] = int(float(self.origin_x_entry.text()))
-        entry["origin_y"] = int(float(self.origin_y_entry.text()))
+        entry["frame_width"] = self.img_width // self._count_x
+        entry["frame_height"] = self.img_height // self._count_y
         
-        entry["frame_width"] = self.img_width // frame_count_x
-        entry["frame_height"] = self.img_height // frame_count_y
+        entry["image_width"] = self.img_width
+        entry["image_height"] = self.img_height
 
-        entry["atlas_page"] = int(float(self.atlas_page_entry.text()))
+        entry["atlas_page"] = self._atlas_page
 
     def on_atlas_page_change(self):
         if not self.current_path:
             return
+        try:
+            self._atlas_page = int(self.atlas_page_entry.text())
+        except ValueError:
+            return
         self.update_data(self.data[self.current_path])
 
     def on_count_change(self):
@@ -485,48 +748,68 @@ class SpriteManager(QMainWindow):
             return
         count_x_text = self.count_x_entry.text()
         count_y_text = self.count_y_entry.text()
-        if count_x_text and not count_y_text:
-            count_y_text = "1"
-            self.count_y_entry.setText(count_y_text)
-        if count_y_text and not count_x_text:
-            count_x_text = "1"
+        if (count_x_text, count_y_text) == self._last_count_text:
+            return
+        # the validator won't commit an empty field, put back the value still in use
+        if not count_x_text:
+            count_x_text = str(self._count_x)
             self.count_x_entry.setText(count_x_text)
+        if not count_y_text:
+            count_y_text = str(self._count_y)
+            self.count_y_entry.setText(count_y_text)
         try:
             count_x = int(count_x_text)
             count_y = int(count_y_text)
             if count_x <= 0:
+                count_x = 1
                 self.count_x_entry.setText("1")
             if count_y <= 0:
+                count_y = 1
                 self.count_y_entry.setText("1")
-            entry = self.data[self.current_path]
-            self.show_image()
-            self.update_data(entry)
+            # e.g. "02" after "2", nothing to redraw
+            if (count_x, count_y) != (self._count_x, self._count_y):
+                self._count_x = count_x
+                self._count_y = count_y
+                entry = self.data[self.current_path]
+                self.update_grid()
+                self.update_data(entry)
         except ValueError:
             pass
+        self._last_count_text = (self.count_x_entry.text(), self.count_y_entry.text())
+
+    def flush_origin(self):
+        self.origin_x_entry.setText(str(self._origin_x))
+        self.origin_y_entry.setText(str(self._origin_y))
+        self._last_origin_text = (self.origin_x_entry.text(), self.origin_y_entry.text())
+        if self.current_path:
+            self.update_data(self.data[self.current_path])
 
     def on_origin_change(self):
-        if self.origin_point:
+        if (self.origin_x_entry.text(), self.origin_y_entry.text()) == self._last_origin_text:
+            return
+        if self.origin_point.isVisible():
+            # the validator won't commit an empty field, put back the value still in use
+            if not self.origin_x_entry.text():
+                self.origin_x_entry.setText(str(self._origin_x))
+            if not self.origin_y_entry.text():
+                self.origin_y_entry.setText(str(self._origin_y))
             try:
-                # int vals only
-                origin_x = int(float(self.origin_x_entry.text()))
-                origin_y = int(float(self.origin_y_entry.text()))
-                
-                # update text fields to show the integer values a float was typed
-                self.origin_x_entry.setText(str(origin_x))
-                self.origin_y_entry.setText(str(origin_y))
-                
-                # convert to zoomed coordinates
-                zoomed_x = origin_x * self.zoom
-                zoomed_y = origin_y * self.zoom
+                # the validator only lets ints through
+                origin_x = int(self.origin_x_entry.text())
+                origin_y = int(self.origin_y_entry.text())
+                self._origin_x = origin_x
+                self._origin_y = origin_y
                 
-                self.origin_point.setPos(zoomed_x, zoomed_y)
+                self.origin_point.setPos(origin_x, origin_y)
                 
                 entry = self.data[self.current_path]
                 self.update_data(entry)
             except ValueError:
                 pass
+        self._last_origin_text = (self.origin_x_entry.text(), self.origin_y_entry.text())
 
     def export_json(self):
+        self.commit_fields()
         if not self.data:
             QMessageBox.critical(self, "Error", "No data to export")
             return
@@ -537,10 +820,19 @@ class SpriteManager(QMainWindow):
             self.update_data(self.data[self.current_path])
         root_folder = os.path.commonpath(self.image_paths)
         save_path = os.path.join(root_folder, f"{JSON_NAME}.json")
-        output = {os.path.relpath(k, root_folder): v for k, v in self.data.items()}
+        # every path lives under root_folder, so slice the prefix off instead of relpath
+        root_len = len(os.path.join(root_folder, ""))
+        output = {k[root_len:]: v for k, v in self.data.items()}
+        # write next to the target and swap it in, a failed save can't truncate the old file
+        tmp_path = save_path + ".tmp"
         try:
-            with open(save_path, "w") as f:
-                json.dump(output, f, indent=4)
+            with open(tmp_path, "wb") as f:
+                f.write(dump_json(output))
+            os.replace(tmp_path, save_path)
             QMessageBox.information(self, "Saved", f"Changes were saved")
         except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             QMessageBox.critical(self, "Error", f"Failed to save: {e}")
\ No newline at end of file